@@ -1,24 +1,52 @@
+import functools
+import json
 from unittest.mock import call, patch
 
 import pytest
 from django import test
 from django.core.cache import cache
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.db import OperationalError
+from django.db import OperationalError, transaction
+from django.db.models.signals import post_save
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 from pytest_django.plugin import DjangoDbBlocker
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 
 from apps.alerts.models import AlertReceiveChannel
 from apps.alerts.models.alert_receive_channel import random_token_generator
 from apps.integrations.mixins import AlertChannelDefiningMixin
 from apps.integrations.mixins.alert_channel_defining_mixin import CHANNEL_DOES_NOT_EXIST_PLACEHOLDER
 from apps.integrations.views import UniversalAPIView
+from apps.user_management.models import Organization
+from apps.user_management.models.user import User, listen_for_user_model_save
+
+# every test here needs the DB, those disabling DB access are also marked explicitly
+pytestmark = pytest.mark.django_db
 
 # https://github.com/pytest-dev/pytest-xdist/issues/432#issuecomment-528510433
 INTEGRATION_TYPES = sorted(AlertReceiveChannel.INTEGRATION_TYPES)
+# integrations not served by the universal endpoint
+NON_UNIVERSAL_INTEGRATION_TYPES = frozenset(
+    {"amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"}
+)
+UNIVERSAL_INTEGRATION_TYPES = tuple(t for t in INTEGRATION_TYPES if t not in NON_UNIVERSAL_INTEGRATION_TYPES)
+# create_alert kwargs queued by the universal endpoint, apart from the request specific ones
+UNIVERSAL_CREATE_ALERT_KWARGS = {
+    "title": None,
+    "message": None,
+    "image_url": None,
+    "link_to_upstream_details": None,
+    "integration_unique_data": None,
+}
+# JSON body posted to the universal endpoint, serialized once instead of rendered on every request
+FOO_BAR_JSON = json.dumps({"foo": "bar"}).encode()
+# the file itself is rebuilt per request, the multipart encoder needs a file-like object to send it as a file
+UPLOADED_FILE_CONTENT = b"file_content"
+# marks the organization shared by this module, so leftovers from an interrupted run can be found
+SHARED_ORGANIZATION_TITLE = "integrations_test_views_shared_organization"
 
 
 class DatabaseBlocker(DjangoDbBlocker):
@@ -39,6 +67,10 @@ class DatabaseBlocker(DjangoDbBlocker):
         raise OperationalError("Database access disabled")
 
 
+# block() returns a new context manager on every call, so a single instance can be reused
+_database_blocker = DatabaseBlocker()
+
+
 def setup_failing_redis_cache(settings):
     settings.DJANGO_REDIS_IGNORE_EXCEPTIONS = True
     settings.RATELIMIT_FAIL_OPEN = True
@@ -50,48 +82,149 @@ def setup_failing_redis_cache(settings):
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _url_template(name, *kwarg_names):
+    return reverse(f"integrations:{name}", kwargs={kwarg_name: f"__{kwarg_name}__" for kwarg_name in kwarg_names})
+
+
+def _url(name, **kwargs):
+    """Resolve each integrations route once with placeholders, then fill in the actual (mostly random) values."""
+    url = _url_template(name, *sorted(kwargs))
+    for kwarg_name, value in kwargs.items():
+        url = url.replace(f"__{kwarg_name}__", str(value))
+    return url
+
+
+# tests not concerned with middlewares call the view directly instead of going through the whole request cycle
+_request_factory = APIRequestFactory()
+_universal_view = UniversalAPIView.as_view()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def locmem_cache():
+    """
+    Run this module's cache dependent tests against the in-memory cache whatever settings module is used
+    (settings.ci_test already configures it). This overrides the configured cache backend for this module only.
+    """
+    with override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}):
+        yield
+
+
+@pytest.fixture(scope="module")
+def shared_org_user(django_db_setup, django_db_blocker, make_organization, make_user):
+    """
+    Organization and user shared by all tests in this module.
+    They are committed outside of the per-test transaction, so they are removed explicitly on teardown.
+    As the test DB is reused between runs, leftovers from an interrupted run are also removed on setup.
+    """
+    with django_db_blocker.unblock():
+        Organization.objects_with_deleted.filter(org_title=SHARED_ORGANIZATION_TITLE).delete()
+        organization = make_organization(org_title=SHARED_ORGANIZATION_TITLE)
+        post_save.disconnect(listen_for_user_model_save, sender=User)
+        user = make_user(organization=organization)
+        post_save.connect(listen_for_user_model_save, sender=User)
+
+    yield organization, user
+
+    with django_db_blocker.unblock():
+        organization.hard_delete()
+
+
+@pytest.fixture(scope="module")
+def shared_channels(shared_org_user, django_db_blocker):
+    """
+    One alert receive channel per integration type, keyed by integration type.
+    Channels are created upfront, as anything created lazily inside a test would be rolled back with it.
+    """
+    organization, user = shared_org_user
+    with django_db_blocker.unblock(), transaction.atomic():
+        # bulk_create skips AlertReceiveChannel.save() (duplicate direct paging check) and the post_save listener,
+        # so these channels deliberately have no default route (ChannelFilter) nor heartbeat: don't rely on them
+        AlertReceiveChannel.objects.bulk_create(
+            [
+                AlertReceiveChannel(
+                    organization=organization,
+                    author=user,
+                    integration=integration_type,
+                    verbal_name=integration_type,
+                )
+                for integration_type in INTEGRATION_TYPES
+            ]
+        )
+        # fetch channels back, bulk_create doesn't set primary keys on all DB backends
+        return {
+            alert_receive_channel.integration: alert_receive_channel
+            for alert_receive_channel in AlertReceiveChannel.objects_with_maintenance.filter(organization=organization)
+        }
+
+
+@pytest.fixture
+def channel_for_type(integration_type, shared_channels):
+    return shared_channels[integration_type]
+
+
+@pytest.fixture
+def warm_channel_cache(shared_channels):
+    """
+    Populate the DB fallback cache with the shared channels.
+    Cache keys are versioned per test (see isolated_cache), so this can't be done once per module.
+    """
+    AlertChannelDefiningMixin().update_alert_receive_channel_fallback_cache()
+
+
+@pytest.fixture(scope="module")
+def api_client():
+    # no authentication is involved in these tests, so a single client can be shared safely
+    return APIClient()
+
+
 @patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
+@pytest.mark.parametrize("integration_type", UNIVERSAL_INTEGRATION_TYPES)
+@pytest.mark.parametrize("case", ["json_ok", "file_rejected", "no_db"])
 @pytest.mark.django_db
 def test_integration_universal_endpoint(
-    mock_create_alert, make_organization_and_user, make_alert_receive_channel, integration_type
+    mock_create_alert, channel_for_type, integration_type, case, api_client, request
 ):
-    organization, user = make_organization_and_user()
-    alert_receive_channel = make_alert_receive_channel(
-        organization=organization,
-        author=user,
-        integration=integration_type,
-    )
+    alert_receive_channel = channel_for_type
 
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=alert_receive_channel.token)
+
+    if case == "file_rejected":
+        test_file = SimpleUploadedFile("testing", UPLOADED_FILE_CONTENT)
+        response = _universal_view(
+            _request_factory.post(url, {"foo": "bar", "f": test_file}),
+            integration_type=integration_type,
+            alert_channel_key=alert_receive_channel.token,
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not mock_create_alert.apply_async.called
+        return
+
+    if case == "no_db":
+        # only the no-DB case reads the fallback cache, the others start with it empty
+        request.getfixturevalue("warm_channel_cache")
 
     data = {"foo": "bar"}
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        if case == "no_db":
+            # disable DB access, the request goes through the whole stack relying on the cache only
+            with _database_blocker.block():
+                response = api_client.post(url, FOO_BAR_JSON, content_type="application/json")
+        else:
+            response = _universal_view(
+                _request_factory.post(url, FOO_BAR_JSON, content_type="application/json"),
+                integration_type=integration_type,
+                alert_channel_key=alert_receive_channel.token,
+            )
     assert response.status_code == status.HTTP_200_OK
 
     mock_create_alert.apply_async.assert_called_once_with(
         [],
         {
-            "title": None,
-            "message": None,
-            "image_url": None,
-            "link_to_upstream_details": None,
+            **UNIVERSAL_CREATE_ALERT_KWARGS,
             "alert_receive_channel_pk": alert_receive_channel.pk,
-            "integration_unique_data": None,
             "raw_request_data": data,
             "received_at": now.isoformat(),
         },
@@ -99,15 +232,7 @@ def test_integration_universal_endpoint(
 
 
 @patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
-@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", UNIVERSAL_INTEGRATION_TYPES)
 def test_integration_universal_endpoint_no_data(
     mock_create_alert, make_organization_and_user, make_alert_receive_channel, integration_type
 ):
@@ -118,10 +243,7 @@ def test_integration_universal_endpoint_no_data(
         integration=integration_type,
     )
 
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=alert_receive_channel.token)
     # django test client forces an empty data in the request, build from scratch instead
     factory = test.RequestFactory()
     req = factory.post(url)
@@ -137,9 +259,8 @@ def test_integration_universal_endpoint_no_data(
 
 
 @patch("apps.integrations.views.create_alertmanager_alerts")
-@pytest.mark.django_db
 def test_integration_grafana_endpoint_wrong_endpoint(
-    mock_create_alertmanager_alerts, make_organization_and_user, make_alert_receive_channel
+    mock_create_alertmanager_alerts, make_organization_and_user, make_alert_receive_channel, api_client
 ):
     integration_type = "grafana_alerting"
     organization, user = make_organization_and_user()
@@ -149,22 +270,19 @@ def test_integration_grafana_endpoint_wrong_endpoint(
         integration=integration_type,
     )
 
-    client = APIClient()
-    url = reverse("integrations:grafana", kwargs={"alert_channel_key": alert_receive_channel.token})
+    url = _url("grafana", alert_channel_key=alert_receive_channel.token)
 
-    response = client.post(url, {}, format="json")
+    response = api_client.post(url, {}, format="json")
     assert response.status_code == status.HTTP_400_BAD_REQUEST
 
     mock_create_alertmanager_alerts.assert_not_called()
 
 
 @patch("apps.integrations.views.create_alertmanager_alerts")
-@pytest.mark.django_db
+@override_settings(DEBUG=False)
 def test_integration_grafana_endpoint_has_alerts(
-    mock_create_alertmanager_alerts, settings, make_organization_and_user, make_alert_receive_channel
+    mock_create_alertmanager_alerts, make_organization_and_user, make_alert_receive_channel, api_client
 ):
-    settings.DEBUG = False
-
     integration_type = "grafana"
     organization, user = make_organization_and_user()
     alert_receive_channel = make_alert_receive_channel(
@@ -173,8 +291,7 @@ def test_integration_grafana_endpoint_has_alerts(
         integration=integration_type,
     )
 
-    client = APIClient()
-    url = reverse("integrations:grafana", kwargs={"alert_channel_key": alert_receive_channel.token})
+    url = _url("grafana", alert_channel_key=alert_receive_channel.token)
 
     data = {
         "alerts": [
@@ -189,24 +306,20 @@ def test_integration_grafana_endpoint_has_alerts(
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, data, format="json")
     assert response.status_code == status.HTTP_200_OK
 
-    mock_create_alertmanager_alerts.apply_async.assert_has_calls(
-        [
-            call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
-            call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
-        ]
-    )
+    assert mock_create_alertmanager_alerts.apply_async.call_args_list == [
+        call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
+        call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
+    ]
 
 
 @patch("apps.integrations.views.create_alert")
-@pytest.mark.django_db
+@override_settings(DEBUG=False)
 def test_integration_old_grafana_endpoint(
-    mock_create_alert, settings, make_organization_and_user, make_alert_receive_channel
+    mock_create_alert, make_organization_and_user, make_alert_receive_channel, api_client
 ):
-    settings.DEBUG = False
-
     integration_type = "grafana"
     organization, user = make_organization_and_user()
     alert_receive_channel = make_alert_receive_channel(
@@ -215,14 +328,13 @@ def test_integration_old_grafana_endpoint(
         integration=integration_type,
     )
 
-    client = APIClient()
-    url = reverse("integrations:grafana", kwargs={"alert_channel_key": alert_receive_channel.token})
+    url = _url("grafana", alert_channel_key=alert_receive_channel.token)
 
     data = {}
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, data, format="json")
     assert response.status_code == status.HTTP_200_OK
 
     mock_create_alert.apply_async.assert_called_once_with(
@@ -240,111 +352,15 @@ def test_integration_old_grafana_endpoint(
     )
 
 
-@patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
-@pytest.mark.django_db
-def test_integration_universal_endpoint_not_allow_files(
-    mock_create_alert, make_organization_and_user, make_alert_receive_channel, integration_type
-):
-    organization, user = make_organization_and_user()
-    alert_receive_channel = make_alert_receive_channel(
-        organization=organization,
-        author=user,
-        integration=integration_type,
-    )
-
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
-
-    test_file = SimpleUploadedFile("testing", b"file_content")
-    data = {"foo": "bar", "f": test_file}
-    response = client.post(url, data)
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
-
-    assert not mock_create_alert.apply_async.called
-
-
-@patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
-@pytest.mark.django_db
-def test_integration_universal_endpoint_works_without_db(
-    mock_create_alert, make_organization_and_user, make_alert_receive_channel, integration_type
-):
-    organization, user = make_organization_and_user()
-    alert_receive_channel = make_alert_receive_channel(
-        organization=organization,
-        author=user,
-        integration=integration_type,
-    )
-
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
-
-    # populate cache
-    AlertChannelDefiningMixin().update_alert_receive_channel_fallback_cache()
-
-    now = timezone.now()
-    with patch("django.utils.timezone.now") as mock_now:
-        mock_now.return_value = now
-        # disable DB access
-        with DatabaseBlocker().block():
-            data = {"foo": "bar"}
-            response = client.post(url, data, format="json")
-
-    assert response.status_code == status.HTTP_200_OK
-
-    mock_create_alert.apply_async.assert_called_once_with(
-        [],
-        {
-            "title": None,
-            "message": None,
-            "image_url": None,
-            "link_to_upstream_details": None,
-            "alert_receive_channel_pk": alert_receive_channel.pk,
-            "integration_unique_data": None,
-            "raw_request_data": data,
-            "received_at": now.isoformat(),
-        },
-    )
-
-
 @patch("apps.integrations.views.create_alertmanager_alerts")
 @pytest.mark.django_db
+@override_settings(DEBUG=False)
 def test_integration_grafana_endpoint_without_db_has_alerts(
-    mock_create_alertmanager_alerts, settings, make_organization_and_user, make_alert_receive_channel
+    mock_create_alertmanager_alerts, shared_channels, warm_channel_cache, api_client
 ):
-    settings.DEBUG = False
-
-    integration_type = "grafana"
-    organization, user = make_organization_and_user()
-    alert_receive_channel = make_alert_receive_channel(
-        organization=organization,
-        author=user,
-        integration=integration_type,
-    )
+    alert_receive_channel = shared_channels["grafana"]
 
-    client = APIClient()
-    url = reverse("integrations:grafana", kwargs={"alert_channel_key": alert_receive_channel.token})
+    url = _url("grafana", alert_channel_key=alert_receive_channel.token)
 
     data = {
         "alerts": [
@@ -357,42 +373,30 @@ def test_integration_grafana_endpoint_without_db_has_alerts(
         ]
     }
 
-    # populate cache
-    AlertChannelDefiningMixin().update_alert_receive_channel_fallback_cache()
-
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
         # disable DB access
-        with DatabaseBlocker().block():
-            response = client.post(url, data, format="json")
+        with _database_blocker.block():
+            response = api_client.post(url, data, format="json")
 
     assert response.status_code == status.HTTP_200_OK
 
-    mock_create_alertmanager_alerts.apply_async.assert_has_calls(
-        [
-            call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
-            call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
-        ]
-    )
+    assert mock_create_alertmanager_alerts.apply_async.call_args_list == [
+        call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
+        call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
+    ]
 
 
 @patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
-@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", UNIVERSAL_INTEGRATION_TYPES)
 def test_integration_universal_endpoint_works_without_cache(
     mock_create_alert,
     make_organization_and_user,
     make_alert_receive_channel,
     integration_type,
     settings,
+    api_client,
 ):
     # setup failing redis cache and ignore exception settings
     setup_failing_redis_cache(settings)
@@ -404,28 +408,20 @@ def test_integration_universal_endpoint_works_without_cache(
         integration=integration_type,
     )
 
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=alert_receive_channel.token)
     data = {"foo": "bar"}
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, FOO_BAR_JSON, content_type="application/json")
 
     assert response.status_code == status.HTTP_200_OK
 
     mock_create_alert.apply_async.assert_called_once_with(
         [],
         {
-            "title": None,
-            "message": None,
-            "image_url": None,
-            "link_to_upstream_details": None,
+            **UNIVERSAL_CREATE_ALERT_KWARGS,
             "alert_receive_channel_pk": alert_receive_channel.pk,
-            "integration_unique_data": None,
             "raw_request_data": data,
             "received_at": now.isoformat(),
         },
@@ -433,9 +429,8 @@ def test_integration_universal_endpoint_works_without_cache(
 
 
 @patch("apps.integrations.views.create_alertmanager_alerts")
-@pytest.mark.django_db
 def test_integration_grafana_endpoint_without_cache_has_alerts(
-    mock_create_alertmanager_alerts, settings, make_organization_and_user, make_alert_receive_channel
+    mock_create_alertmanager_alerts, settings, make_organization_and_user, make_alert_receive_channel, api_client
 ):
     settings.DEBUG = False
     # setup failing redis cache and ignore exception settings
@@ -449,8 +444,7 @@ def test_integration_grafana_endpoint_without_cache_has_alerts(
         integration=integration_type,
     )
 
-    client = APIClient()
-    url = reverse("integrations:grafana", kwargs={"alert_channel_key": alert_receive_channel.token})
+    url = _url("grafana", alert_channel_key=alert_receive_channel.token)
 
     data = {
         "alerts": [
@@ -465,33 +459,24 @@ def test_integration_grafana_endpoint_without_cache_has_alerts(
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, data, format="json")
 
     assert response.status_code == status.HTTP_200_OK
 
-    mock_create_alertmanager_alerts.apply_async.assert_has_calls(
-        [
-            call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
-            call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
-        ]
-    )
+    assert mock_create_alertmanager_alerts.apply_async.call_args_list == [
+        call((alert_receive_channel.pk, data["alerts"][0]), kwargs={"received_at": now.isoformat()}),
+        call((alert_receive_channel.pk, data["alerts"][1]), kwargs={"received_at": now.isoformat()}),
+    ]
 
 
 @patch("apps.integrations.views.create_alert")
-@pytest.mark.parametrize(
-    "integration_type",
-    [
-        arc_type
-        for arc_type in INTEGRATION_TYPES
-        if arc_type not in ["amazon_sns", "grafana", "alertmanager", "grafana_alerting", "maintenance"]
-    ],
-)
-@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", UNIVERSAL_INTEGRATION_TYPES)
 def test_integration_outdated_cached_model(
     mock_create_alert,
     make_organization_and_user,
     make_alert_receive_channel,
     integration_type,
+    api_client,
 ):
     organization, user = make_organization_and_user()
     alert_receive_channel = make_alert_receive_channel(
@@ -504,28 +489,20 @@ def test_integration_outdated_cached_model(
     cache_key = AlertChannelDefiningMixin.CACHE_KEY_SHORT_TERM + "_" + alert_receive_channel.token
     cache.set(cache_key, '{"some": "invalid json model"}')
 
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=alert_receive_channel.token)
     data = {"foo": "bar"}
     now = timezone.now()
     with patch("django.utils.timezone.now") as mock_now:
         mock_now.return_value = now
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, FOO_BAR_JSON, content_type="application/json")
 
     assert response.status_code == status.HTTP_200_OK
 
     mock_create_alert.apply_async.assert_called_once_with(
         [],
         {
-            "title": None,
-            "message": None,
-            "image_url": None,
-            "link_to_upstream_details": None,
+            **UNIVERSAL_CREATE_ALERT_KWARGS,
             "alert_receive_channel_pk": alert_receive_channel.pk,
-            "integration_unique_data": None,
             "raw_request_data": data,
             "received_at": now.isoformat(),
         },
@@ -538,26 +515,17 @@ def test_integration_outdated_cached_model(
     "apps.alerts.models.AlertReceiveChannel.objects.get",
     wraps=AlertReceiveChannel.objects.get,
 )
-@pytest.mark.parametrize(
-    "integration_type",
-    [arc_type for arc_type in INTEGRATION_TYPES],
-)
-@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", INTEGRATION_TYPES)
 def test_non_existent_integration_does_not_repeat_access_db(
-    mock_db_get, mock_cache_set, mock_cache_get, integration_type
+    mock_db_get, mock_cache_set, mock_cache_get, integration_type, api_client
 ):
     attempts = 5
     non_existent_integration_token = random_token_generator()
     cache_key = AlertChannelDefiningMixin.CACHE_KEY_SHORT_TERM + "_" + non_existent_integration_token
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": non_existent_integration_token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=non_existent_integration_token)
 
     for _ in range(attempts):
-        data = {"foo": "bar"}
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, FOO_BAR_JSON, content_type="application/json")
         mock_cache_get.assert_called_with(cache_key)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -574,11 +542,7 @@ def test_non_existent_integration_does_not_repeat_access_db(
     "apps.alerts.models.AlertReceiveChannel.objects.get",
     wraps=AlertReceiveChannel.objects.get,
 )
-@pytest.mark.parametrize(
-    "integration_type",
-    [arc_type for arc_type in INTEGRATION_TYPES],
-)
-@pytest.mark.django_db
+@pytest.mark.parametrize("integration_type", INTEGRATION_TYPES)
 def test_deleted_integration_does_not_repeat_access_db(
     mock_db_get,
     mock_cache_set,
@@ -586,6 +550,7 @@ def test_deleted_integration_does_not_repeat_access_db(
     make_organization_and_user,
     make_alert_receive_channel,
     integration_type,
+    api_client,
 ):
     attempts = 5
     organization, user = make_organization_and_user()
@@ -598,16 +563,11 @@ def test_deleted_integration_does_not_repeat_access_db(
     cache_key = AlertChannelDefiningMixin.CACHE_KEY_SHORT_TERM + "_" + alert_receive_channel.token
     alert_receive_channel.delete()
 
-    client = APIClient()
-    url = reverse(
-        "integrations:universal",
-        kwargs={"integration_type": integration_type, "alert_channel_key": alert_receive_channel.token},
-    )
+    url = _url("universal", integration_type=integration_type, alert_channel_key=alert_receive_channel.token)
 
     mock_cache_get.reset_mock()
     for _ in range(attempts):
-        data = {"foo": "bar"}
-        response = client.post(url, data, format="json")
+        response = api_client.post(url, FOO_BAR_JSON, content_type="application/json")
         mock_cache_get.assert_called_with(cache_key)
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
@@ -231,7 +231,8 @@ def mock_is_labels_feature_enabled_for_org(settings):
     return _mock_is_labels_feature_enabled_for_org
 
 
-@pytest.fixture
+# session scoped (the factory holds no state) so module scoped fixtures can build their data the same way
+@pytest.fixture(scope="session")
 def make_organization():
     def _make_organization(**kwargs):
         if "is_rbac_permissions_enabled" not in kwargs:
@@ -417,7 +418,8 @@ def get_user_permission_role_mapping_from_frontend_plugin_json() -> RoleMapping:
 ROLE_PERMISSION_MAPPING = get_user_permission_role_mapping_from_frontend_plugin_json()
 
 
-@pytest.fixture
+# session scoped (the factory holds no state) so module scoped fixtures can build their data the same way
+@pytest.fixture(scope="session")
 def make_user():
     def _make_user(role: typing.Optional[LegacyAccessControlRole] = None, **kwargs):
         role = LegacyAccessControlRole.ADMIN if role is None else role